@@ -1,10 +1,19 @@
 # python
+import array
+import calendar
+import functools
+import io
+import mmap
 import pickle
-from collections import UserDict
-from datetime import datetime, timedelta
+import re
+import sys
+import types
+from datetime import date, datetime
 
 
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -12,20 +21,31 @@ class Field:
         return str(self.value)
 
 
-class Name(Field):
-    def __str__(self):
-        return self.value.title()
+_PHONE_RE = re.compile(r"\A\d{10}\Z")
 
 
-class Phone(Field):
-    def __init__(self, value):
-        v = str(value).strip()
-        if not (len(v) == 10 and v.isdigit()):
-            raise ValueError("Incorrect phone number format.")
-        super().__init__(v)
+@functools.lru_cache(maxsize=4096)
+def _validate_phone(v: str) -> str:
+    """Return v if it is a 10-digit phone number, otherwise raise ValueError."""
+    if not _PHONE_RE.match(v):
+        raise ValueError("Incorrect phone number format.")
+    return v
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_birthday(s: str) -> datetime:
+    """Parse a DD.MM.YYYY string; raises ValueError on bad input."""
+    day, month, year = s[0:2], s[3:5], s[6:10]
+    if not (len(s) == 10 and s[2] == "." and s[5] == "."
+            and day.isdigit() and month.isdigit() and year.isdigit()):
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    # datetime() itself rejects out-of-range days and months
+    return datetime(int(year), int(month), int(day))
 
 
 class Birthday(Field):
+    __slots__ = ("md", "formatted")
+
     def __init__(self, value):
         try:
             if isinstance(value, datetime):
@@ -34,60 +54,100 @@ class Birthday(Field):
                 s = str(value).strip()
                 if not s:
                     raise ValueError("Invalid date format. Use DD.MM.YYYY")
-                dt = datetime.strptime(s, "%d.%m.%Y")
+                dt = _parse_birthday(s)
             super().__init__(dt)
+            # (month, day) key used for upcoming birthday lookups
+            self.md = (dt.month, dt.day)
+            # DD.MM.YYYY representation, formatted once
+            self.formatted = f"{dt.day:02d}.{dt.month:02d}.{dt.year:04d}"
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
 
 
 class Record:
+    __slots__ = ("name", "phones", "birthday", "book")
+
     def __init__(self, name):
-        self.name = Name(name)
-        self.phones = []
+        self.name: str = name
+        # Validated phone numbers used as an insertion-ordered set
+        self.phones: dict[str, None] = {}
         self.birthday = None
+        # AddressBook this record is filed in; keeps its birthday index current
+        self.book = None
 
     def add_phone(self, phone):
-        self.phones.append(Phone(phone))
+        self.phones[_validate_phone(str(phone).strip())] = None
 
     def edit_phone(self, old_phone, new_phone):
-        for i, phone in enumerate(self.phones):
-            if phone.value == old_phone:
-                self.phones[i] = Phone(new_phone)
-                break
+        if old_phone in self.phones:
+            new_phone = _validate_phone(str(new_phone).strip())
+            del self.phones[old_phone]
+            self.phones[new_phone] = None
 
     def find_phone(self, phone):
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        return phone if phone in self.phones else None
 
     def remove_phone(self, phone):
-        for i, p in enumerate(self.phones):
-            if p.value == phone:
-                del self.phones[i]
-                return True
+        if phone in self.phones:
+            del self.phones[phone]
+            return True
         return False
 
     def add_birthday(self, birthday):
         self.birthday = Birthday(birthday)
+        if self.book is not None:
+            self.book._register_birthday(self.name)
 
     def __str__(self):
-        birthday_str = f", birthday: {self.birthday.value.strftime('%d.%m.%Y')}" if self.birthday else ""
-        return f"Contact name: {self.name.value}, phones: {'; '.join(p.value for p in self.phones)}{birthday_str}"
+        birthday_str = f", birthday: {self.birthday.formatted}" if self.birthday else ""
+        return f"Contact name: {self.name}, phones: {'; '.join(self.phones)}{birthday_str}"
 
 
-class AddressBook(UserDict):
+class AddressBook(dict):
     def __init__(self):
-        super().__init__()
+        # (month, day) -> names of contacts born that day, in insertion order
+        self._by_birthday = {}
+        # Name -> (month, day) key the contact is filed under in _by_birthday
+        self._birthday_keys = {}
 
     def add_record(self, record):
-        self.data[record.name.value] = record
+        # Interned keys let dict lookups with interned names match by identity
+        name = record.name = sys.intern(record.name)
+        replaced = self.get(name)
+        if replaced is not None and replaced is not record:
+            replaced.book = None
+        self[name] = record
+        record.book = self
+        if record.birthday is None:
+            self._unregister_birthday(name)
+        else:
+            self._register_birthday(name)
+
+    @property
+    def data(self):
+        """The book itself; kept for code written against the UserDict API."""
+        return self
 
     def find(self, name):
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name):
-        del self.data[name]
+        self.pop(name).book = None
+        self._unregister_birthday(name)
+
+    def _register_birthday(self, name):
+        self._unregister_birthday(name)
+        md = self[name].birthday.md
+        self._birthday_keys[name] = md
+        self._by_birthday.setdefault(md, {})[name] = None
+
+    def _unregister_birthday(self, name):
+        md = self._birthday_keys.pop(name, None)
+        if md is not None:
+            names = self._by_birthday[md]
+            del names[name]
+            if not names:
+                del self._by_birthday[md]
 
     def get_upcoming_birthdays(self) -> list[dict[str, str]]:
         """
@@ -101,81 +161,133 @@ class AddressBook(UserDict):
                  (the contact's name) and 'congratulation_date' (a string representing
                  the adjusted congratulation date in 'DD.MM.YYYY' format).
         """
-        today = datetime.today().date()
+        today_ordinal = datetime.today().toordinal()
+
+        # Map (month, day) of each of the next 7 days (including today) to
+        # its congratulation date
+        window = {}
+        for day_ordinal in range(today_ordinal, today_ordinal + 7):
+            day = date.fromordinal(day_ordinal)
+
+            # Check if birthday falls on weekend and move it to Monday
+            # weekday(): Monday=0, Tuesday=1, ..., Saturday=5, Sunday=6
+            weekday = day.weekday()
+            if weekday == 5:  # Saturday
+                congratulation_date = date.fromordinal(day_ordinal + 2)
+            elif weekday == 6:  # Sunday
+                congratulation_date = date.fromordinal(day_ordinal + 1)
+            else:
+                congratulation_date = day
+
+            formatted = (
+                f"{congratulation_date.day:02d}.{congratulation_date.month:02d}.{congratulation_date.year:04d}"
+            )
+            # In non-leap years 29 February birthdays are celebrated on 1 March
+            if day.month == 3 and day.day == 1 and not calendar.isleap(day.year):
+                window[(2, 29)] = formatted
+            window[(day.month, day.day)] = formatted
+
         upcoming_birthdays = []
+        # Only contacts filed under one of the window's days are visited
+        for md, congratulation_date in window.items():
+            for name in self._by_birthday.get(md, ()):
+                upcoming_birthdays.append({
+                    "name": name,
+                    "congratulation_date": congratulation_date
+                })
 
-        for record in self.data.values():
-            # Skip contacts without birthday
-            if record.birthday is None:
-                continue
+        return upcoming_birthdays
 
-            birthday = record.birthday.value.date()
 
-            # Set birthday for current year
-            birthday_this_year = birthday.replace(year=today.year)
+# Files written by save_data start with this tag. Files tagged _ROWS_MAGIC use
+# the earlier per-record layout; untagged files are a legacy pickle of the
+# whole AddressBook object.
+FILE_MAGIC = b"ABK2"
+_ROWS_MAGIC = b"ABK1"
 
-            # If birthday has passed this year, consider next year
-            if birthday_this_year < today:
-                birthday_this_year = birthday_this_year.replace(year=today.year + 1)
 
-            # Calculate days until birthday
-            days_until_birthday = (birthday_this_year - today).days
+def _book_to_columns(book: AddressBook) -> tuple[list[str], list[list[str]], array.array]:
+    """Split records into parallel name, phone and birthday ordinal columns.
 
-            # Check if birthday is within next 7 days (including today)
-            # 0 - today, 1-6 - next 6 days, total 7 days
-            if 0 <= days_until_birthday <= 6:
-                # Set congratulation date
-                congratulation_date = birthday_this_year
+    A birthday ordinal of 0 means the contact has no birthday.
+    """
+    records = book.values()
+    names = list(book)
+    phones = [list(record.phones) for record in records]
+    birthdays = array.array(
+        "i", [record.birthday.value.toordinal() if record.birthday else 0 for record in records]
+    )
+    return names, phones, birthdays
 
-                # Check if birthday falls on weekend
-                # weekday(): Monday=0, Tuesday=1, ..., Saturday=5, Sunday=6
-                if congratulation_date.weekday() == 5:  # Saturday
-                    # Move to Monday (add 2 days)
-                    congratulation_date = congratulation_date + timedelta(days=2)
-                elif congratulation_date.weekday() == 6:  # Sunday
-                    # Move to Monday (add 1 day)
-                    congratulation_date = congratulation_date + timedelta(days=1)
 
-                # Add to list
-                upcoming_birthdays.append({
-                    "name": record.name.value,
-                    "congratulation_date": congratulation_date.strftime("%d.%m.%Y")
-                })
+def _book_from_rows(rows) -> AddressBook:
+    """Rebuild an AddressBook from (name, phones, birthday ordinal) tuples."""
+    book = AddressBook()
+    for name, phones, birthday_ordinal in rows:
+        record = Record(name)
+        for phone in phones:
+            record.add_phone(phone)
+        if birthday_ordinal:
+            record.add_birthday(datetime.fromordinal(birthday_ordinal))
+        book.add_record(record)
+    return book
 
-        return upcoming_birthdays
+
+class _LegacyUnpickler(pickle.Unpickler):
+    """Unpickler for pre-FILE_MAGIC files that pickled the AddressBook object.
+
+    The pickled record classes no longer exist or use __slots__ and cannot
+    restore that __dict__ state, so they are loaded as plain namespaces instead.
+    """
+
+    LEGACY_CLASSES = {"AddressBook", "Record", "Field", "Name", "Phone", "Birthday"}
+
+    def find_class(self, module, name):
+        if name in self.LEGACY_CLASSES:
+            return types.SimpleNamespace
+        return super().find_class(module, name)
 
 
 def save_data(book: AddressBook, filename: str = "addressbook.pkl"):
-    """Serialize and save AddressBook to disk using pickle."""
+    """Serialize and save AddressBook to disk as parallel per-field columns."""
+    # Serialize in memory so the file is written with a single call
+    buf = io.BytesIO()
+    buf.write(FILE_MAGIC)
+    pickle.dump(_book_to_columns(book), buf, protocol=pickle.HIGHEST_PROTOCOL)
+    data = buf.getvalue()
+    buf.close()
     with open(filename, "wb") as f:
-        pickle.dump(book, f)
+        f.write(data)
 
 
 def load_data(filename: str = "addressbook.pkl") -> AddressBook:
     """Load AddressBook from disk or return a new one if file not found."""
     try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
+        f = open(filename, "rb")
     except FileNotFoundError:
         return AddressBook()
 
-
-def input_error(func):
-    """Decorator to handle input errors."""
-
-    def inner(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except ValueError as e:
-            return str(e)
-        except KeyError:
-            return "Contact not found."
-        except IndexError:
-            return "Invalid command format. Please provide all required arguments."
-        except Exception as e:
-            return f"An error occurred: {str(e)}"
-
-    return inner
+    # Unpickle straight from the mapped file, without an intermediate bytes copy
+    with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        magic = mm[:len(FILE_MAGIC)]
+        if magic in (FILE_MAGIC, _ROWS_MAGIC):
+            with memoryview(mm)[len(FILE_MAGIC):] as payload:
+                rows = pickle.loads(payload)
+            if magic == FILE_MAGIC:
+                names, phones, birthdays = rows
+                rows = zip(names, phones, birthdays)
+            return _book_from_rows(rows)
+        # Legacy file: a pickled AddressBook object with a list of Phone objects
+        legacy = _LegacyUnpickler(io.BytesIO(mm)).load()
+
+    return _book_from_rows(
+        (
+            record.name.value,
+            [p.value for p in record.phones],
+            record.birthday.value.toordinal() if record.birthday else 0,
+        )
+        for record in legacy.data.values()
+    )
 
 
 def parse_input(user_input):
@@ -185,10 +297,10 @@ def parse_input(user_input):
     return cmd, *args
 
 
-@input_error
 def add_contact(args, book: AddressBook):
     """Add a new contact or add phone to existing contact."""
     name, phone, *_ = args
+    name = sys.intern(name)
     record = book.find(name)
     message = "Contact updated."
     if record is None:
@@ -200,13 +312,13 @@ def add_contact(args, book: AddressBook):
     return message
 
 
-@input_error
 def change_contact(args, book: AddressBook):
     """Change phone number for existing contact."""
     if len(args) < 3:
         return "Please provide name, old phone, and new phone."
 
     name, old_phone, new_phone, *_ = args
+    name = sys.intern(name)
     record = book.find(name)
 
     if record is None:
@@ -220,13 +332,13 @@ def change_contact(args, book: AddressBook):
     return "Phone number updated."
 
 
-@input_error
 def show_phone(args, book: AddressBook):
     """Show phone numbers for a contact."""
     if len(args) < 1:
         return "Please provide a name."
 
     name, *_ = args
+    name = sys.intern(name)
     record = book.find(name)
 
     if record is None:
@@ -235,29 +347,28 @@ def show_phone(args, book: AddressBook):
     if not record.phones:
         return f"{name} has no phone numbers."
 
-    phones = "; ".join(p.value for p in record.phones)
+    phones = "; ".join(record.phones)
     return f"{name}: {phones}"
 
 
-@input_error
 def show_all(args, book: AddressBook):
     """Show all contacts in the address book."""
-    if not book.data:
+    if not book:
         return "Address book is empty."
 
     result = []
-    for record in book.data.values():
+    for record in book.values():
         result.append(str(record))
     return "\n".join(result)
 
 
-@input_error
 def add_birthday(args, book: AddressBook):
     """Add birthday to a contact."""
     if len(args) < 2:
         return "Please provide name and birthday (DD.MM.YYYY)."
 
     name, birthday, *_ = args
+    name = sys.intern(name)
     record = book.find(name)
 
     if record is None:
@@ -267,13 +378,13 @@ def add_birthday(args, book: AddressBook):
     return f"Birthday added for {name}."
 
 
-@input_error
 def show_birthday(args, book: AddressBook):
     """Show birthday for a contact."""
     if len(args) < 1:
         return "Please provide a name."
 
     name, *_ = args
+    name = sys.intern(name)
     record = book.find(name)
 
     if record is None:
@@ -282,10 +393,9 @@ def show_birthday(args, book: AddressBook):
     if record.birthday is None:
         return f"{name} has no birthday set."
 
-    return f"{name}'s birthday: {record.birthday.value.strftime('%d.%m.%Y')}"
+    return f"{name}'s birthday: {record.birthday.formatted}"
 
 
-@input_error
 def birthdays(args, book: AddressBook):
     """Show upcoming birthdays in the next 7 days."""
     upcoming = book.get_upcoming_birthdays()
@@ -300,6 +410,18 @@ def birthdays(args, book: AddressBook):
     return "\n".join(result)
 
 
+# Command name -> handler(args, book) returning the message to print
+HANDLERS = {
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": show_all,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
+
 def main():
     book = load_data()
     print("Welcome to the assistant bot!")
@@ -317,29 +439,19 @@ def main():
             elif command == "hello":
                 print("How can I help you?")
 
-            elif command == "add":
-                print(add_contact(args, book))
-
-            elif command == "change":
-                print(change_contact(args, book))
-
-            elif command == "phone":
-                print(show_phone(args, book))
-
-            elif command == "all":
-                print(show_all(args, book))
-
-            elif command == "add-birthday":
-                print(add_birthday(args, book))
-
-            elif command == "show-birthday":
-                print(show_birthday(args, book))
-
-            elif command == "birthdays":
-                print(birthdays(args, book))
-
             else:
-                print("Invalid command.")
+                handler = HANDLERS.get(command)
+                if handler is None:
+                    print("Invalid command.")
+                else:
+                    try:
+                        print(handler(args, book))
+                    except ValueError as e:
+                        print(e)
+                    except KeyError:
+                        print("Contact not found.")
+                    except IndexError:
+                        print("Invalid command format. Please provide all required arguments.")
     except (KeyboardInterrupt, EOFError):
         # Ensure data is saved on interrupt/EOF
         print("\nGood bye!")
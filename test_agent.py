@@ -0,0 +1,71 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+import agent
+from agent import AddressBook, Record
+
+
+def _date_in(days):
+    return (datetime.today() + timedelta(days=days)).strftime("%d.%m.%Y")
+
+
+class UpcomingBirthdaysTest(unittest.TestCase):
+    def test_birthday_added_through_found_record_is_indexed(self):
+        book = AddressBook()
+        book.add_record(Record("A"))
+
+        book.find("A").add_birthday(_date_in(1))
+
+        names = [entry["name"] for entry in book.get_upcoming_birthdays()]
+        self.assertEqual(names, ["A"])
+
+    def test_redated_birthday_moves_out_of_old_bucket(self):
+        book = AddressBook()
+        record = Record("A")
+        record.add_birthday(_date_in(1))
+        book.add_record(record)
+
+        book.find("A").add_birthday(_date_in(100))
+
+        self.assertEqual(book.get_upcoming_birthdays(), [])
+
+    def test_deleted_or_replaced_record_no_longer_updates_book(self):
+        book = AddressBook()
+        deleted = Record("A")
+        book.add_record(deleted)
+        book.delete("A")
+        replaced = Record("B")
+        book.add_record(replaced)
+        book.add_record(Record("B"))
+
+        deleted.add_birthday(_date_in(1))
+        replaced.add_birthday(_date_in(1))
+
+        self.assertEqual(book.get_upcoming_birthdays(), [])
+
+    def _upcoming_on(self, book, today):
+        fake_datetime = mock.Mock(wraps=datetime)
+        fake_datetime.today.return_value = today
+        with mock.patch.object(agent, "datetime", fake_datetime):
+            return book.get_upcoming_birthdays()
+
+    def test_leap_day_birthday_celebrated_on_march_first_in_common_year(self):
+        book = AddressBook()
+        record = Record("A")
+        record.add_birthday("29.02.2000")
+        book.add_record(record)
+
+        # 1 March 2027 is a Monday
+        self.assertEqual(
+            self._upcoming_on(book, datetime(2027, 2, 25)),
+            [{"name": "A", "congratulation_date": "01.03.2027"}],
+        )
+        self.assertEqual(
+            self._upcoming_on(book, datetime(2028, 2, 25)),
+            [{"name": "A", "congratulation_date": "29.02.2028"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()